@@ -1,30 +1,38 @@
 import os
 import random
 import asyncio
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import discord
+from aiohttp import web
 from discord.ext import commands
 from dotenv import load_dotenv
 
-from flask import Flask
-from threading import Thread
+# health-check server; runs on the bot's event loop (started in main, before login)
+async def home(request: web.Request) -> web.Response:
+    return web.Response(text="OK")
 
-app = Flask(__name__)
+async def health(request: web.Request) -> web.Response:
+    return web.Response(text="healthy")
 
-@app.get("/")
-def home():
-    return "OK", 200
+app = web.Application()
+app.router.add_get("/", home)
+app.router.add_get("/health", health)
 
-@app.get("/health")
-def health():
-    return "healthy", 200
-
-def run_web():
-    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", "3000")))
+async def run_web() -> Optional[web.AppRunner]:
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, "0.0.0.0", int(os.environ.get("PORT", "3000"))).start()
+    except OSError as exc:
+        # never let the health endpoint take the bot down
+        print(f"Health server failed to start: {exc}")
+        await runner.cleanup()
+        return None
+    return runner
 
-Thread(target=run_web, daemon=True).start()
 # =========================
 # ENV
 # =========================
@@ -43,6 +51,8 @@ WORDS_FILE = "words.txt"
 MIN_PLAYERS = 3
 MAX_CLUE_LEN = 80
 
+LOBBY_REFRESH_DELAY = 0.3  # coalesce join/leave bursts into one lobby edit
+
 TURN_TIMEOUT = 75
 BETWEEN_TURNS = 0.6
 
@@ -60,24 +70,16 @@ def load_words() -> List[str]:
     words: List[str] = []
     if os.path.exists(WORDS_FILE):
         with open(WORDS_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                w = line.strip()
-                if not w or w.startswith("#"):
-                    continue
-                if " " in w:
-                    continue
-                words.append(w.upper())
+            # filter + uppercase + dedupe (first-seen order) in one pass
+            words = list(dict.fromkeys(
+                w.upper() for w in (line.strip() for line in f)
+                if w and not w.startswith("#") and " " not in w
+            ))
 
     if not words:
         words = ["PIZZA", "AIRPLANE", "VOLCANO", "BICYCLE", "CHOCOLATE", "PYRAMID", "ROBOT", "CASTLE"]
 
-    seen = set()
-    out = []
-    for w in words:
-        if w not in seen:
-            seen.add(w)
-            out.append(w)
-    return out
+    return words
 
 
 WORDS = load_words()
@@ -86,13 +88,13 @@ WORDS = load_words()
 # =========================
 # STATE
 # =========================
-@dataclass
+@dataclass(slots=True)
 class Player:
     user_id: int
     alive: bool = True  # kept for potential future, but no ejections now
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     guild_id: int
     channel_id: int
@@ -100,15 +102,18 @@ class GameState:
 
     started: bool = False
 
-    # players dict + join order list (order must NOT change)
+    # players dict; insertion order is the fixed join order (must NOT change)
     players: Dict[int, Player] = field(default_factory=dict)
-    join_order: List[int] = field(default_factory=list)
+    display_names: Dict[int, str] = field(default_factory=dict)  # captured at join
 
     secret_word: Optional[str] = None
+    secret_word_cf: Optional[str] = None  # casefolded once for clue checks
     imposters: Set[int] = field(default_factory=set)
 
-    # lobby msg for buttons
-    lobby_message_id: Optional[int] = None
+    # lobby msg for buttons (cached so refreshes skip a fetch)
+    lobby_message: Optional[discord.Message] = None
+    lobby_refresh_pending: bool = False
+    lobby_refresh_task: Optional[asyncio.Task] = None
 
     # round/turn
     round_no: int = 0
@@ -118,32 +123,50 @@ class GameState:
 
     # turn tracking for interactions
     expecting_clue_from: Optional[int] = None
+    clue_event: asyncio.Event = field(default_factory=asyncio.Event)
 
     # voting (final)
     voting_open: bool = False
     votes: Dict[int, int] = field(default_factory=dict)  # voter_id -> target_id (0=skip)
+    vote_options: List[discord.SelectOption] = field(default_factory=list)  # built once at start
     vote_task: Optional[asyncio.Task] = None
 
     # loop task
     game_task: Optional[asyncio.Task] = None
 
+    # Held only while mutating state. Read-only early-exit checks in interaction
+    # callbacks skip it: everything runs on one event loop, and a plain read
+    # can't interleave with a writer unless it awaits.
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
+    # alive_players() result; reset via invalidate_alive() when players/alive change
+    _alive_cache: Optional[Tuple[int, ...]] = field(default=None, init=False, repr=False, compare=False)
+
     def is_host(self, uid: int) -> bool:
         return uid == self.host_id
 
-    def alive_players(self) -> List[int]:
-        # fixed order: join_order filtered by alive
-        return [uid for uid in self.join_order if uid in self.players and self.players[uid].alive]
+    def alive_players(self) -> Tuple[int, ...]:
+        # fixed order: players (join order) filtered by alive
+        if self._alive_cache is None:
+            self._alive_cache = tuple(uid for uid, p in self.players.items() if p.alive)
+        return self._alive_cache
 
+    def invalidate_alive(self):
+        self._alive_cache = None
 
-GAMES: Dict[Tuple[int, int], GameState] = {}
+
+GAMES: Dict[int, GameState] = {}  # keyed by channel id (globally unique)
 
 
 # =========================
 # BOT
 # =========================
-intents = discord.Intents.all()
+# only what we use: guild messages + content (for commands / imposter count reply).
+# No members/presences: mention() falls back to <@id>, names come from display_names.
+intents = discord.Intents.default()
+intents.message_content = True
+intents.members = False
+intents.presences = False
 
 
 bot = commands.Bot(command_prefix=PREFIX, intents=intents, help_command=None)
@@ -166,7 +189,13 @@ def name(guild: discord.Guild, uid: int) -> str:
     return m.display_name if m else str(uid)
 
 
-def fmt_list(guild: discord.Guild, ids: List[int]) -> str:
+def player_name(guild: discord.Guild, state: "GameState", uid: int) -> str:
+    # prefer the name captured at join; avoids a member cache lookup
+    n = state.display_names.get(uid)
+    return n if n is not None else name(guild, uid)
+
+
+def fmt_list(guild: discord.Guild, ids: Sequence[int]) -> str:
     return ", ".join(mention(guild, i) for i in ids) if ids else "—"
 
 
@@ -174,8 +203,8 @@ def imposter_options(n: int) -> List[int]:
     return [1, 2] if n >= ALLOW_2_IMPOSTERS_AT else [1]
 
 
-def get_state_from_channel(guild_id: int, channel_id: int) -> Optional[GameState]:
-    return GAMES.get((guild_id, channel_id))
+def get_state_from_channel(channel_id: int) -> Optional[GameState]:
+    return GAMES.get(channel_id)
 
 
 # =========================
@@ -190,7 +219,7 @@ class LobbyView(discord.ui.View):
         if not interaction.guild or not isinstance(interaction.channel, discord.TextChannel):
             return await interaction.response.send_message("Server channel only.", ephemeral=True)
 
-        state = get_state_from_channel(interaction.guild.id, interaction.channel.id)
+        state = get_state_from_channel(interaction.channel.id)
         if not state:
             return await interaction.response.send_message("No lobby here. Host should use `!startgame` to create one.", ephemeral=True)
 
@@ -201,9 +230,10 @@ class LobbyView(discord.ui.View):
                 return await interaction.response.send_message("You’re already in the lobby.", ephemeral=True)
 
             state.players[interaction.user.id] = Player(user_id=interaction.user.id)
-            state.join_order.append(interaction.user.id)
+            state.display_names[interaction.user.id] = interaction.user.display_name
+            state.invalidate_alive()
 
-        await refresh_lobby_embed(interaction.guild, interaction.channel, state)
+        schedule_lobby_refresh(interaction.guild, interaction.channel, state)
         await interaction.response.send_message("✅ Joined the lobby!", ephemeral=True)
 
     @discord.ui.button(label="Leave", style=discord.ButtonStyle.danger, emoji="➖", custom_id="imposter:lobby_leave")
@@ -211,7 +241,7 @@ class LobbyView(discord.ui.View):
         if not interaction.guild or not isinstance(interaction.channel, discord.TextChannel):
             return await interaction.response.send_message("Server channel only.", ephemeral=True)
 
-        state = get_state_from_channel(interaction.guild.id, interaction.channel.id)
+        state = get_state_from_channel(interaction.channel.id)
         if not state:
             return await interaction.response.send_message("No lobby here.", ephemeral=True)
 
@@ -223,35 +253,55 @@ class LobbyView(discord.ui.View):
 
             # host leaving closes lobby
             if interaction.user.id == state.host_id:
-                GAMES.pop((interaction.guild.id, interaction.channel.id), None)
+                GAMES.pop(interaction.channel.id, None)
                 return await interaction.response.send_message("🧹 Host left — lobby closed.", ephemeral=True)
 
             # remove player
             del state.players[interaction.user.id]
-            state.join_order = [uid for uid in state.join_order if uid != interaction.user.id]
+            state.display_names.pop(interaction.user.id, None)
+            state.invalidate_alive()
 
-        await refresh_lobby_embed(interaction.guild, interaction.channel, state)
+        schedule_lobby_refresh(interaction.guild, interaction.channel, state)
         await interaction.response.send_message("✅ Left the lobby.", ephemeral=True)
 
 
+# stateless, so one persistent instance is shared by every lobby message
+LOBBY_VIEW = LobbyView()
+
+
+def schedule_lobby_refresh(guild: discord.Guild, channel: discord.TextChannel, state: GameState):
+    state.lobby_refresh_pending = True
+    if state.lobby_refresh_task and not state.lobby_refresh_task.done():
+        return  # running task will pick up the latest state
+
+    async def run():
+        try:
+            while state.lobby_refresh_pending:
+                await asyncio.sleep(LOBBY_REFRESH_DELAY)
+                # clear before editing so changes during the edit trigger another pass
+                state.lobby_refresh_pending = False
+                await refresh_lobby_embed(guild, channel, state)
+        except asyncio.CancelledError:
+            return
+
+    state.lobby_refresh_task = asyncio.create_task(run())
+
+
 async def refresh_lobby_embed(guild: discord.Guild, channel: discord.TextChannel, state: GameState):
-    if not state.lobby_message_id:
-        return
-    try:
-        msg = await channel.fetch_message(state.lobby_message_id)
-    except discord.NotFound:
-        state.lobby_message_id = None
+    if not state.lobby_message:
         return
 
-    ids = list(state.players.keys())
-    ordered = state.join_order[:]  # already in correct fixed order
+    ordered = list(state.players)  # already in correct fixed order
 
     emb = e("🎭 Imposter — Lobby", "Click **Join** to enter. When ready, host runs **!startgame** again to begin.")
     emb.add_field(name="Host", value=mention(guild, state.host_id), inline=True)
-    emb.add_field(name="Players", value=f"{len(ids)}", inline=True)
+    emb.add_field(name="Players", value=f"{len(ordered)}", inline=True)
     emb.add_field(name="Fixed Order", value=fmt_list(guild, ordered), inline=False)
     emb.set_footer(text="No DMs. Roles are revealed privately (ephemeral) after start.")
-    await msg.edit(embed=emb, view=LobbyView())
+    try:
+        await state.lobby_message.edit(embed=emb, view=LOBBY_VIEW)
+    except discord.NotFound:
+        state.lobby_message = None
 
 
 # =========================
@@ -259,63 +309,67 @@ async def refresh_lobby_embed(guild: discord.Guild, channel: discord.TextChannel
 # =========================
 class RevealRoleView(discord.ui.View):
     def __init__(self):
-        super().__init__(timeout=300)
+        super().__init__(timeout=None)
 
-    @discord.ui.button(label="Reveal Role", style=discord.ButtonStyle.primary, emoji="🎭")
+    @discord.ui.button(label="Reveal Role", style=discord.ButtonStyle.primary, emoji="🎭", custom_id="imposter:reveal_role")
     async def reveal(self, interaction: discord.Interaction, button: discord.ui.Button):
         if not interaction.guild or not isinstance(interaction.channel, discord.TextChannel):
             return await interaction.response.send_message("Server channel only.", ephemeral=True)
 
-        state = get_state_from_channel(interaction.guild.id, interaction.channel.id)
+        state = get_state_from_channel(interaction.channel.id)
         if not state or not state.started:
             return await interaction.response.send_message("No active game here.", ephemeral=True)
 
         uid = interaction.user.id
-        async with state.lock:
-            if uid not in state.players:
-                return await interaction.response.send_message("You’re not in this game.", ephemeral=True)
+        # read-only, no lock
+        if uid not in state.players:
+            return await interaction.response.send_message("You’re not in this game.", ephemeral=True)
 
-            if uid in state.imposters:
-                emb = e("🕵️ You are the IMPOSTER", "Blend in. Don’t get caught.", discord.Color.red())
-                emb.add_field(name="Secret Word", value="❌ You don’t know it.", inline=False)
-            else:
-                emb = e("✅ You are a CIVILIAN", "Give clues that hint the word without saying it.", discord.Color.green())
-                emb.add_field(name="Secret Word", value=f"**{state.secret_word}**", inline=False)
+        if uid in state.imposters:
+            emb = e("🕵️ You are the IMPOSTER", "Blend in. Don’t get caught.", discord.Color.red())
+            emb.add_field(name="Secret Word", value="❌ You don’t know it.", inline=False)
+        else:
+            emb = e("✅ You are a CIVILIAN", "Give clues that hint the word without saying it.", discord.Color.green())
+            emb.add_field(name="Secret Word", value=f"**{state.secret_word}**", inline=False)
 
         await interaction.response.send_message(embed=emb, ephemeral=True)
 
 
+# stateless, so one persistent instance is shared by every reveal message
+REVEAL_ROLE_VIEW = RevealRoleView()
+
+
 # =========================
 # TURN CLUE MODAL + VIEW
 # =========================
 class TurnClueView(discord.ui.View):
     def __init__(self):
-        super().__init__(timeout=TURN_TIMEOUT + 10)
+        super().__init__(timeout=None)
 
-    @discord.ui.button(label="Submit Clue", style=discord.ButtonStyle.success, emoji="✍️")
+    @discord.ui.button(label="Submit Clue", style=discord.ButtonStyle.success, emoji="✍️", custom_id="imposter:turn_submit")
     async def submit(self, interaction: discord.Interaction, button: discord.ui.Button):
         if not interaction.guild or not isinstance(interaction.channel, discord.TextChannel):
             return await interaction.response.send_message("Server channel only.", ephemeral=True)
 
-        state = get_state_from_channel(interaction.guild.id, interaction.channel.id)
+        state = get_state_from_channel(interaction.channel.id)
         if not state or not state.started:
             return await interaction.response.send_message("No active game here.", ephemeral=True)
 
         uid = interaction.user.id
 
-        async with state.lock:
-            if state.voting_open:
-                return await interaction.response.send_message("Voting is open — no clues right now.", ephemeral=True)
+        # read-only gate, no lock; ClueModal re-checks before writing
+        if state.voting_open:
+            return await interaction.response.send_message("Voting is open — no clues right now.", ephemeral=True)
 
-            if uid not in state.players:
-                return await interaction.response.send_message("You’re not in this game.", ephemeral=True)
+        if uid not in state.players:
+            return await interaction.response.send_message("You’re not in this game.", ephemeral=True)
 
-            if state.expecting_clue_from != uid:
-                who = mention(interaction.guild, state.expecting_clue_from) if state.expecting_clue_from else "—"
-                return await interaction.response.send_message(f"Not your turn. Current turn: {who}", ephemeral=True)
+        if state.expecting_clue_from != uid:
+            who = mention(interaction.guild, state.expecting_clue_from) if state.expecting_clue_from else "—"
+            return await interaction.response.send_message(f"Not your turn. Current turn: {who}", ephemeral=True)
 
-            if uid in state.current_round_clues:
-                return await interaction.response.send_message("You already submitted this round.", ephemeral=True)
+        if uid in state.current_round_clues:
+            return await interaction.response.send_message("You already submitted this round.", ephemeral=True)
 
         await interaction.response.send_modal(ClueModal())
 
@@ -332,7 +386,7 @@ class ClueModal(discord.ui.Modal, title="Submit your clue"):
         if not interaction.guild or not isinstance(interaction.channel, discord.TextChannel):
             return await interaction.response.send_message("Server channel only.", ephemeral=True)
 
-        state = get_state_from_channel(interaction.guild.id, interaction.channel.id)
+        state = get_state_from_channel(interaction.channel.id)
         if not state or not state.started:
             return await interaction.response.send_message("No active game here.", ephemeral=True)
 
@@ -341,22 +395,27 @@ class ClueModal(discord.ui.Modal, title="Submit your clue"):
         if not clue_text:
             return await interaction.response.send_message("Clue can’t be empty.", ephemeral=True)
 
-        async with state.lock:
-            if state.voting_open:
-                return await interaction.response.send_message("Voting is open — no clues right now.", ephemeral=True)
+        if state.voting_open:
+            return await interaction.response.send_message("Voting is open — no clues right now.", ephemeral=True)
+
+        if state.expecting_clue_from != uid:
+            who = mention(interaction.guild, state.expecting_clue_from) if state.expecting_clue_from else "—"
+            return await interaction.response.send_message(f"Not your turn. Current turn: {who}", ephemeral=True)
 
-            if state.expecting_clue_from != uid:
-                who = mention(interaction.guild, state.expecting_clue_from) if state.expecting_clue_from else "—"
-                return await interaction.response.send_message(f"Not your turn. Current turn: {who}", ephemeral=True)
+        # block exact word
+        if state.secret_word_cf and clue_text.casefold() == state.secret_word_cf:
+            return await interaction.response.send_message("Don’t type the exact secret word.", ephemeral=True)
 
-            # block exact word
-            if state.secret_word and clue_text.upper() == state.secret_word.upper():
-                return await interaction.response.send_message("Don’t type the exact secret word.", ephemeral=True)
+        async with state.lock:
+            # turn may have ended (or a clue already landed) while waiting for the lock
+            if state.voting_open or state.expecting_clue_from != uid or uid in state.current_round_clues:
+                return await interaction.response.send_message("Your turn ended before the clue arrived.", ephemeral=True)
 
             state.current_round_clues[uid] = clue_text
+            state.clue_event.set()
 
         # Publicly show: "Endi: nice smell"
-        await interaction.channel.send(f"**{name(interaction.guild, uid)}:** {clue_text}")
+        await interaction.channel.send(f"**{player_name(interaction.guild, state, uid)}:** {clue_text}")
         await interaction.response.send_message("✅ Clue submitted!", ephemeral=True)
 
 
@@ -383,18 +442,21 @@ class VoteView(discord.ui.View):
 
     async def _record(self, interaction: discord.Interaction, target_id: int):
         uid = interaction.user.id
+        if not self.state.voting_open:
+            return await interaction.response.send_message("Voting is closed.", ephemeral=True)
+        if uid not in self.state.players:
+            return await interaction.response.send_message("Only players can vote.", ephemeral=True)
+
+        if target_id != 0:
+            if target_id == uid:
+                return await interaction.response.send_message("You can’t vote yourself.", ephemeral=True)
+            if target_id not in self.state.players:
+                return await interaction.response.send_message("That player isn’t in this game.", ephemeral=True)
+
         async with self.state.lock:
+            # voting may have closed while waiting for the lock
             if not self.state.voting_open:
                 return await interaction.response.send_message("Voting is closed.", ephemeral=True)
-            if uid not in self.state.players:
-                return await interaction.response.send_message("Only players can vote.", ephemeral=True)
-
-            if target_id != 0:
-                if target_id == uid:
-                    return await interaction.response.send_message("You can’t vote yourself.", ephemeral=True)
-                if target_id not in self.state.players:
-                    return await interaction.response.send_message("That player isn’t in this game.", ephemeral=True)
-
             self.state.votes[uid] = target_id
 
         if target_id == 0:
@@ -408,26 +470,23 @@ class VoteSelect(discord.ui.Select):
         self.guild = guild
         self.state = state
 
-        opts = []
-        for pid in state.alive_players():  # fixed order list
-            m = guild.get_member(pid)
-            label = (m.display_name if m else str(pid))[:100]
-            opts.append(discord.SelectOption(label=label, value=str(pid)))
-
-        super().__init__(placeholder="Who is the imposter?", min_values=1, max_values=1, options=opts)
+        super().__init__(placeholder="Who is the imposter?", min_values=1, max_values=1, options=state.vote_options)
 
     async def callback(self, interaction: discord.Interaction):
         target_id = int(self.values[0])
         uid = interaction.user.id
 
+        if not self.state.voting_open:
+            return await interaction.response.send_message("Voting is closed.", ephemeral=True)
+        if uid not in self.state.players:
+            return await interaction.response.send_message("Only players can vote.", ephemeral=True)
+        if target_id == uid:
+            return await interaction.response.send_message("You can’t vote yourself.", ephemeral=True)
+
         async with self.state.lock:
+            # voting may have closed while waiting for the lock
             if not self.state.voting_open:
                 return await interaction.response.send_message("Voting is closed.", ephemeral=True)
-            if uid not in self.state.players:
-                return await interaction.response.send_message("Only players can vote.", ephemeral=True)
-            if target_id == uid:
-                return await interaction.response.send_message("You can’t vote yourself.", ephemeral=True)
-
             self.state.votes[uid] = target_id
 
         await interaction.response.send_message(f"✅ Vote recorded for {mention(interaction.guild, target_id)}.", ephemeral=True)
@@ -461,23 +520,19 @@ async def finalize_final_voting(guild: discord.Guild, channel: discord.TextChann
             return
 
         # count votes
-        counts: Dict[int, int] = {}
-        for voter, target in state.votes.items():
-            if voter not in state.players:
-                continue
-            if target != 0 and target not in state.players:
-                continue
-            counts[target] = counts.get(target, 0) + 1
+        counts = Counter(
+            target for voter, target in state.votes.items()
+            if voter in state.players and (target == 0 or target in state.players)
+        )
 
         # top voted (for fun display)
         top_target: Optional[int] = None
         if counts:
             # ignore skip when picking top guess if possible
-            non_skip = {k: v for k, v in counts.items() if k != 0}
+            non_skip = Counter({k: v for k, v in counts.items() if k != 0})
             pool = non_skip if non_skip else counts
-            max_votes = max(pool.values())
-            top = [pid for pid, c in pool.items() if c == max_votes]
-            top_target = top[0] if len(top) == 1 else None
+            top = pool.most_common(2)
+            top_target = top[0][0] if len(top) == 1 or top[0][1] != top[1][1] else None
 
         state.voting_open = False
 
@@ -487,7 +542,7 @@ async def finalize_final_voting(guild: discord.Guild, channel: discord.TextChann
     # public summary of votes
     summary = []
     if counts:
-        for pid, c in sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:12]:
+        for pid, c in counts.most_common(12):
             if pid == 0:
                 summary.append(f"⏭️ Skip: **{c}**")
             else:
@@ -507,7 +562,7 @@ async def finalize_final_voting(guild: discord.Guild, channel: discord.TextChann
 
     # END GAME + LOBBY (clear state)
     await channel.send(embed=e("🧹 Game ended", "Lobby cleared. Use `!startgame` to create a new one.", discord.Color.orange()))
-    GAMES.pop((guild.id, channel.id), None)
+    GAMES.pop(channel.id, None)
 
 
 # =========================
@@ -530,28 +585,47 @@ async def game_loop(guild: discord.Guild, channel: discord.TextChannel, state: G
 
             await channel.send(embed=e(f"🌀 Round {state.round_no} begins!", f"Order is fixed:\n{fmt_list(guild, turn_order)}"))
 
-            # turns in fixed order
-            for pid in turn_order:
-                async with state.lock:
-                    if state.voting_open:
-                        return
-                    state.expecting_clue_from = pid
-
-                turn_embed = e("✍️ Submit your clue", f"It’s {mention(guild, pid)}’s turn.\nClick **Submit Clue**.")
-                turn_embed.set_footer(text=f"Timeout: {TURN_TIMEOUT}s")
-                await channel.send(embed=turn_embed, view=TurnClueView())
-
-                success = await wait_for_player_clue(state, pid, TURN_TIMEOUT)
-                if not success:
+            # turns in fixed order; one turn message per round, edited each turn.
+            # The view is stopped when the round ends so discord.py drops it from its view store.
+            turn_view = TurnClueView()
+            turn_message: Optional[discord.Message] = None
+            try:
+                for pid in turn_order:
                     async with state.lock:
-                        if pid not in state.current_round_clues:
-                            state.current_round_clues[pid] = "… (timed out)"
-                    await channel.send(f"**{name(guild, pid)}:** … (timed out)")
+                        if state.voting_open:
+                            return
+                        state.clue_event.clear()
+                        state.expecting_clue_from = pid
+
+                    turn_embed = e("✍️ Submit your clue", f"It’s {mention(guild, pid)}’s turn.\nClick **Submit Clue**.")
+                    turn_embed.set_footer(text=f"Timeout: {TURN_TIMEOUT}s")
+                    if turn_message is not None:
+                        try:
+                            await turn_message.edit(embed=turn_embed)
+                        except discord.NotFound:
+                            turn_message = None
+                    if turn_message is None:
+                        turn_message = await channel.send(embed=turn_embed, view=turn_view)
+
+                    try:
+                        await asyncio.wait_for(state.clue_event.wait(), TURN_TIMEOUT)
+                        success = True
+                    except asyncio.TimeoutError:
+                        success = False
+                    if not success:
+                        async with state.lock:
+                            # close the turn together with the marker so a late clue can't overwrite it
+                            state.expecting_clue_from = None
+                            if pid not in state.current_round_clues:
+                                state.current_round_clues[pid] = "… (timed out)"
+                        await channel.send(f"**{player_name(guild, state, pid)}:** … (timed out)")
 
-                async with state.lock:
-                    state.expecting_clue_from = None
+                    async with state.lock:
+                        state.expecting_clue_from = None
 
-                await asyncio.sleep(BETWEEN_TURNS)
+                    await asyncio.sleep(BETWEEN_TURNS)
+            finally:
+                turn_view.stop()
 
             # recap after full round
             async with state.lock:
@@ -559,11 +633,8 @@ async def game_loop(guild: discord.Guild, channel: discord.TextChannel, state: G
                 state.history.append((state.round_no, round_clues))
 
             recap = e(f"📜 Round {state.round_no} Recap", "Clues submitted this round:")
-            lines = []
-            for pid in turn_order:
-                clue = round_clues.get(pid, "—")
-                lines.append(f"• **{name(guild, pid)}:** `{clue}`")
-            recap.add_field(name="Clues", value="\n".join(lines) if lines else "—", inline=False)
+            body = "\n".join(f"• **{player_name(guild, state, pid)}:** `{round_clues.get(pid, '—')}`" for pid in turn_order)
+            recap.add_field(name="Clues", value=body or "—", inline=False)
             await channel.send(embed=recap)
 
             # after N rounds -> FINAL VOTE -> reveal -> end
@@ -575,37 +646,31 @@ async def game_loop(guild: discord.Guild, channel: discord.TextChannel, state: G
         return
 
 
-async def wait_for_player_clue(state: GameState, player_id: int, timeout: float) -> bool:
-    end = asyncio.get_event_loop().time() + timeout
-    while asyncio.get_event_loop().time() < end:
-        async with state.lock:
-            if player_id in state.current_round_clues:
-                return True
-        await asyncio.sleep(0.2)
-    return False
-
-
 # =========================
 # COMMANDS
 # =========================
+# static embeds, built once
+HELP_EMBED = e("🎭 Imposter — Help")
+HELP_EMBED.add_field(name="Commands", value="`!rules` `!help` `!startgame` `!endgame`", inline=False)
+HELP_EMBED.add_field(name="Lobby", value="Join using the **Join** button on the lobby message.", inline=False)
+HELP_EMBED.add_field(name="Order", value="Order is fixed by join order and never changes.", inline=False)
+HELP_EMBED.add_field(name="Roles", value="After game starts, click **Reveal Role** (private/ephemeral).", inline=False)
+HELP_EMBED.add_field(name="Flow", value=f"Plays {ROUNDS_BEFORE_FINAL_VOTE} rounds → recap each round → final vote → reveal → ends.", inline=False)
+
+RULES_EMBED = e("📜 Rules")
+RULES_EMBED.add_field(name="Clues", value=f"On your turn, click Submit Clue and type a short clue (max {MAX_CLUE_LEN}).", inline=False)
+RULES_EMBED.add_field(name="Order", value="Order is fixed (join order).", inline=False)
+RULES_EMBED.add_field(name="Voting", value="After the final round, everyone votes who the imposter is. Then roles + word are revealed.", inline=False)
+
+
 @bot.command(name="help")
 async def cmd_help(ctx: commands.Context):
-    h = e("🎭 Imposter — Help")
-    h.add_field(name="Commands", value="`!rules` `!help` `!startgame` `!endgame`", inline=False)
-    h.add_field(name="Lobby", value="Join using the **Join** button on the lobby message.", inline=False)
-    h.add_field(name="Order", value="Order is fixed by join order and never changes.", inline=False)
-    h.add_field(name="Roles", value="After game starts, click **Reveal Role** (private/ephemeral).", inline=False)
-    h.add_field(name="Flow", value=f"Plays {ROUNDS_BEFORE_FINAL_VOTE} rounds → recap each round → final vote → reveal → ends.", inline=False)
-    await ctx.send(embed=h)
+    await ctx.send(embed=HELP_EMBED)
 
 
 @bot.command(name="rules")
 async def cmd_rules(ctx: commands.Context):
-    r = e("📜 Rules")
-    r.add_field(name="Clues", value=f"On your turn, click Submit Clue and type a short clue (max {MAX_CLUE_LEN}).", inline=False)
-    r.add_field(name="Order", value="Order is fixed (join order).", inline=False)
-    r.add_field(name="Voting", value="After the final round, everyone votes who the imposter is. Then roles + word are revealed.", inline=False)
-    await ctx.send(embed=r)
+    await ctx.send(embed=RULES_EMBED)
 
 
 @bot.command(name="endgame")
@@ -613,18 +678,20 @@ async def cmd_endgame(ctx: commands.Context):
     if not ctx.guild or not isinstance(ctx.channel, discord.TextChannel):
         return
 
-    state = get_state_from_channel(ctx.guild.id, ctx.channel.id)
+    state = get_state_from_channel(ctx.channel.id)
     if not state:
         return await ctx.send(embed=e("❌ No game here", "Nothing to end.", discord.Color.red()))
     if not state.is_host(ctx.author.id):
         return await ctx.send(embed=e("⛔ Host only", f"Host is {mention(ctx.guild, state.host_id)}.", discord.Color.red()))
 
     async with state.lock:
+        if state.lobby_refresh_task and not state.lobby_refresh_task.done():
+            state.lobby_refresh_task.cancel()
         if state.vote_task and not state.vote_task.done():
             state.vote_task.cancel()
         if state.game_task and not state.game_task.done():
             state.game_task.cancel()
-        GAMES.pop((ctx.guild.id, ctx.channel.id), None)
+        GAMES.pop(ctx.channel.id, None)
 
     await ctx.send(embed=e("🧹 Ended", "Lobby/game cleared.", discord.Color.orange()))
 
@@ -634,24 +701,24 @@ async def cmd_startgame(ctx: commands.Context):
     if not ctx.guild or not isinstance(ctx.channel, discord.TextChannel):
         return
 
-    key = (ctx.guild.id, ctx.channel.id)
-    state = GAMES.get(key)
+    state = GAMES.get(ctx.channel.id)
 
     # Create lobby if missing
     if not state:
         state = GameState(guild_id=ctx.guild.id, channel_id=ctx.channel.id, host_id=ctx.author.id)
         state.players[ctx.author.id] = Player(user_id=ctx.author.id)
-        state.join_order.append(ctx.author.id)
-        GAMES[key] = state
+        state.display_names[ctx.author.id] = ctx.author.display_name
+        state.invalidate_alive()
+        GAMES[ctx.channel.id] = state
 
         lobby_embed = e("🎭 Imposter — Lobby", "Click **Join** to enter. When ready, host runs **!startgame** again to begin.")
         lobby_embed.add_field(name="Host", value=mention(ctx.guild, state.host_id), inline=True)
         lobby_embed.add_field(name="Players", value="1", inline=True)
-        lobby_embed.add_field(name="Fixed Order", value=fmt_list(ctx.guild, state.join_order), inline=False)
+        lobby_embed.add_field(name="Fixed Order", value=fmt_list(ctx.guild, list(state.players)), inline=False)
         lobby_embed.set_footer(text="No DMs. Roles are revealed privately (ephemeral) after start.")
-        lobby_msg = await ctx.channel.send(embed=lobby_embed, view=LobbyView())
+        lobby_msg = await ctx.channel.send(embed=lobby_embed, view=LOBBY_VIEW)
         async with state.lock:
-            state.lobby_message_id = lobby_msg.id
+            state.lobby_message = lobby_msg
 
         return await ctx.send(embed=e("✅ Lobby created", "Players can join with the button. Run `!startgame` again to start.", discord.Color.green()))
 
@@ -663,7 +730,7 @@ async def cmd_startgame(ctx: commands.Context):
         if state.started:
             return await ctx.send(embed=e("⚠️ Already started", "Game is already running.", discord.Color.orange()))
         if len(state.players) < MIN_PLAYERS:
-            await refresh_lobby_embed(ctx.guild, ctx.channel, state)
+            schedule_lobby_refresh(ctx.guild, ctx.channel, state)
             return await ctx.send(embed=e("❌ Not enough players", f"Need at least {MIN_PLAYERS}.", discord.Color.red()))
 
     # Choose imposter count
@@ -686,25 +753,31 @@ async def cmd_startgame(ctx: commands.Context):
     async with state.lock:
         state.started = True
         state.secret_word = random.choice(WORDS)
-        ids = list(state.players.keys())
-        state.imposters = set(random.sample(ids, k=imp_count))
+        state.secret_word_cf = state.secret_word.casefold()
+        state.imposters = set(random.sample(tuple(state.players), k=imp_count))
         state.round_no = 0
         state.history.clear()
         state.voting_open = False
         state.votes.clear()
         state.expecting_clue_from = None
 
+        # roster is frozen from here on, so the vote options can be built now
+        state.vote_options = [
+            discord.SelectOption(label=state.display_names.get(pid, str(pid))[:100], value=str(pid))
+            for pid in state.alive_players()  # fixed order list
+        ]
+
         # prevent double loops
         if state.game_task and not state.game_task.done():
             state.game_task.cancel()
 
-    start_embed = e("🚀 Game started!", f"Order is fixed:\n{fmt_list(ctx.guild, state.join_order)}")
+    start_embed = e("🚀 Game started!", f"Order is fixed:\n{fmt_list(ctx.guild, list(state.players))}")
     start_embed.add_field(name="Next", value="Everyone click **Reveal Role** below (private).", inline=False)
     start_embed.add_field(name="Game length", value=f"{ROUNDS_BEFORE_FINAL_VOTE} rounds → final vote → reveal → end", inline=False)
     await ctx.send(embed=start_embed)
     await ctx.channel.send(
         embed=e("🎭 Reveal your role", "Click the button. Your role/word is shown only to you (ephemeral)."),
-        view=RevealRoleView()
+        view=REVEAL_ROLE_VIEW
     )
 
     async with state.lock:
@@ -714,10 +787,29 @@ async def cmd_startgame(ctx: commands.Context):
 # =========================
 # READY
 # =========================
+@bot.event
+async def setup_hook():
+    bot.add_view(LOBBY_VIEW)
+    bot.add_view(REVEAL_ROLE_VIEW)
+
+
 @bot.event
 async def on_ready():
     print(f"Logged in as {bot.user} (id={bot.user.id})")
-    bot.add_view(LobbyView())
 
 
-bot.run(TOKEN)
\ No newline at end of file
+async def main():
+    runner = await run_web()
+    try:
+        async with bot:
+            await bot.start(TOKEN)
+    finally:
+        if runner:
+            await runner.cleanup()
+
+
+discord.utils.setup_logging()
+try:
+    asyncio.run(main())
+except KeyboardInterrupt:
+    pass
\ No newline at end of file